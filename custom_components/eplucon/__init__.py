@@ -2,48 +2,162 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import random
+import time
 from datetime import timedelta
+from typing import Any
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, current_entry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import (
+    CACHE_TTL_FACTOR,
+    COALESCE_WINDOW_SECONDS,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    SCAN_INTERVAL_JITTER,
+    SCAN_INTERVALS,
+    STALE_MAX_SECONDS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
 from .eplucon_api import EpluconAPI
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
-DEFAULT_SCAN_INTERVAL = timedelta(minutes=1)
+# Value index entry of a sensor missing from the data
+_MISSING: tuple[Any, bool] = (None, False)
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Eplucon from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+def _store(hass: HomeAssistant, key: str) -> Store:
+    """Return the store holding the last fetched data of a portal account."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{key}")
+
+
+def _credentials_key(entry: ConfigEntry) -> str:
+    """Return the key identifying the portal account of a config entry."""
+    credentials = f"{entry.data['email']}:{entry.data['password']}"
+    return hashlib.sha1(credentials.encode()).hexdigest()
+
+
+def _get_or_create_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> tuple[EpluconDataUpdateCoordinator, bool]:
+    """Return the coordinator shared by all entries using the same account.
+
+    The second item tells whether the coordinator was newly created and
+    still needs its first refresh.
+    """
+    by_creds = hass.data[DOMAIN].setdefault("by_creds", {})
+    key = _credentials_key(entry)
+    # Remember the key so a later change of the credentials cannot break
+    # unload or leave the stored data of the old account behind on removal
+    hass.data[DOMAIN]["entry_keys"][entry.entry_id] = key
 
-    # Create API instance
+    if key in by_creds:
+        shared = by_creds[key]
+        shared["refcount"] += 1
+        _LOGGER.debug("Reusing existing coordinator for entry %s", entry.entry_id)
+        return shared["coordinator"], False
+
+    scan_interval = SCAN_INTERVALS[
+        entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    ]
+
+    # Create API instance, caching data for slightly less than a poll cycle
     api = EpluconAPI(
         email=entry.data["email"],
-        password=entry.data["password"]
+        password=entry.data["password"],
+        cache_ttl=CACHE_TTL_FACTOR * scan_interval.total_seconds(),
     )
 
-    # Create data update coordinator
-    coordinator = EpluconDataUpdateCoordinator(
-        hass=hass,
-        api=api,
-        scan_interval=timedelta(minutes=entry.data.get("scan_interval", 1))
-    )
+    # Create data update coordinator outside of the entry's context, so the
+    # base class does not bind it to, and shut it down with, this one entry
+    token = current_entry.set(None)
+    try:
+        coordinator = EpluconDataUpdateCoordinator(
+            hass=hass,
+            api=api,
+            scan_interval=scan_interval,
+            store=_store(hass, key),
+        )
+    finally:
+        current_entry.reset(token)
+
+    # Register before the first refresh so concurrently loading entries share it
+    by_creds[key] = {"coordinator": coordinator, "refcount": 1}
+    return coordinator, True
+
+
+async def _async_release_coordinator(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Release an entry's coordinator, dropping it once its last entry is gone."""
+    coordinator = hass.data[DOMAIN].pop(entry.entry_id)
 
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_config_entry_first_refresh()
+    by_creds = hass.data[DOMAIN]["by_creds"]
+    key = hass.data[DOMAIN]["entry_keys"][entry.entry_id]
+    by_creds[key]["refcount"] -= 1
+    if by_creds[key]["refcount"] <= 0:
+        del by_creds[key]
+        await coordinator.async_shutdown()
+        # Write a pending save now so it cannot recreate a removed store later
+        await coordinator.async_save()
+        await coordinator.api.close()
+
+
+async def _async_remove_store(hass: HomeAssistant, key: str) -> None:
+    """Remove the persisted data of an account no loaded entry uses."""
+    if key not in hass.data.get(DOMAIN, {}).get("by_creds", {}):
+        await _store(hass, key).async_remove()
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Eplucon from a config entry."""
+    hass.data.setdefault(DOMAIN, {})
+
+    entry_keys = hass.data[DOMAIN].setdefault("entry_keys", {})
+    old_key = entry_keys.get(entry.entry_id)
+    coordinator, created = _get_or_create_coordinator(hass, entry)
+    if old_key not in (None, entry_keys[entry.entry_id]):
+        # The credentials changed since the entry was last set up
+        await _async_remove_store(hass, old_key)
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Set up all platforms for this device/service
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    needs_refresh = created
+    if created and await coordinator.async_restore():
+        # Start from the persisted data and refresh it in the background
+        hass.async_create_task(coordinator.async_refresh())
+        needs_refresh = False
+
+    if not needs_refresh:
+        # Set up all platforms for this device/service
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        return True
+
+    # Fetch initial data while the platforms are set up; entities created
+    # before the data arrives pick it up from the first coordinator update
+    refresh_result, setup_result = await asyncio.gather(
+        coordinator.async_first_refresh(),
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        return_exceptions=True,
+    )
+
+    for result in (refresh_result, setup_result):
+        if isinstance(result, BaseException):
+            if not isinstance(setup_result, BaseException):
+                await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+            await _async_release_coordinator(hass, entry)
+            raise result
 
     return True
 
@@ -51,38 +165,199 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        await _async_release_coordinator(hass, entry)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted data of a deleted config entry."""
+    key = hass.data.get(DOMAIN, {}).get("entry_keys", {}).pop(entry.entry_id, None)
+    await _async_remove_store(hass, key or _credentials_key(entry))
+
+
 class EpluconDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the Eplucon API."""
 
+    # The base class keeps a __dict__, slots only cover this class' attributes
+    __slots__ = (
+        "api",
+        "_scan_interval",
+        "_store",
+        "_stored",
+        "_save_pending",
+        "_last_ok",
+        "_inflight",
+        "_fetched",
+        "_value_index",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
         api: EpluconAPI,
         scan_interval: timedelta,
+        store: Store,
     ) -> None:
         """Initialize."""
         self.api = api
+        self._scan_interval = scan_interval
+        self._store = store
+        self._stored: dict | None = None
+        self._save_pending = False
+        # Monotonic timestamp and payload of the last successful fetch
+        self._last_ok: tuple[float, dict] | None = None
+        # Fetch currently in progress and the last raw fetch result
+        self._inflight: asyncio.Future | None = None
+        self._fetched: tuple[float, dict] | None = None
+        # Value and presence per sensor of the current data
+        self._value_index: dict[str, tuple[Any, bool]] = {}
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=scan_interval,
+            update_interval=self._jittered_interval(),
+            # Only notify the sensors when the data actually changed
+            always_update=False,
+        )
+
+    def _jittered_interval(self) -> timedelta:
+        """Return the scan interval with a random deviation applied.
+
+        Keeps installations from polling the portal in lockstep.
+        """
+        return self._scan_interval * random.uniform(
+            1 - SCAN_INTERVAL_JITTER, 1 + SCAN_INTERVAL_JITTER
         )
 
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh with a freshly jittered interval."""
+        self.update_interval = self._jittered_interval()
+        super()._schedule_refresh()
+
     async def _async_update_data(self):
         """Update data via library."""
         try:
-            # Login to Eplucon if needed
-            if not self.api.is_authenticated:
-                await self.api.login()
-
-            # Fetch heat pump data
-            data = await self.api.get_heat_pump_data()
-            return data
+            data = await self.async_fetch()
         except Exception as exception:
-            raise UpdateFailed(f"Error communicating with API: {exception}")
+            # Serve the last good payload during short portal outages
+            if self._last_ok is not None:
+                timestamp, cached = self._last_ok
+                if time.monotonic() - timestamp < STALE_MAX_SECONDS:
+                    _LOGGER.warning(
+                        "Error communicating with API, keeping last known data: %s",
+                        exception,
+                    )
+                    return self._index_values({**cached, "_stale": True})
+            raise UpdateFailed(f"Error communicating with API: {exception}") from exception
+
+        self._last_ok = (time.monotonic(), data)
+
+        # Persist in the background so the next start can skip the first
+        # fetch and the login. A pending save picks up the latest data when
+        # it is written, so it is not rescheduled on every poll.
+        self._stored = {
+            "ts": time.time(),
+            "data": data,
+            "module_index": self.api.account_module_index,
+            "cookies": self.api.export_cookies(),
+        }
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+        return self._index_values({**data, "_stale": False})
+
+    async def async_first_refresh(self) -> None:
+        """Refresh data for the first time when a config entry is set up.
+
+        Raises ConfigEntryNotReady if the refresh fails. Replaces
+        async_config_entry_first_refresh, which requires the coordinator
+        to be bound to a single config entry.
+        """
+        await self.async_refresh()
+        if not self.last_update_success:
+            raise ConfigEntryNotReady from self.last_exception
+
+    def _index_values(self, data: dict) -> dict:
+        """Index the values of new data for get_value and return the data."""
+        self._value_index = {key: (value, True) for key, value in data.items()}
+        return data
+
+    def get_value(self, sensor_type: str) -> tuple[Any, bool]:
+        """Return the value of a sensor and whether the data contains it."""
+        return self._value_index.get(sensor_type, _MISSING)
+
+    async def async_save(self) -> None:
+        """Write pending data to the store right away."""
+        if self._save_pending:
+            self._save_pending = False
+            await self._store.async_save(self._stored)
+
+    def _data_to_store(self) -> dict | None:
+        """Return the data to persist."""
+        self._save_pending = False
+        return self._stored
+
+    async def async_restore(self) -> bool:
+        """Load the persisted data if it is recent enough.
+
+        The persisted account module index and session cookies are
+        restored regardless of age. Returns whether data was restored.
+        """
+        stored = await self._store.async_load()
+        if stored is None:
+            return False
+
+        if module_index := stored.get("module_index"):
+            self.api.account_module_index = module_index
+        if cookies := stored.get("cookies"):
+            self.api.restore_cookies(cookies)
+
+        age = time.time() - stored["ts"]
+        if age >= MAX_SCAN_INTERVAL * 60:
+            return False
+
+        # Serve the restored data if the portal is down right after a restart
+        self._last_ok = (time.monotonic() - age, stored["data"])
+        self.async_set_updated_data(
+            self._index_values({**stored["data"], "_stale": True})
+        )
+        return True
+
+    async def async_fetch(self, force: bool = False) -> dict:
+        """Fetch heat pump data, sharing one request between concurrent callers.
+
+        Callers arriving while a fetch is in progress await that fetch, and
+        callers arriving shortly after it completed get its result. Pass
+        force=True to bypass the latter.
+        """
+        if self._inflight is None:
+            if (
+                not force
+                and self._fetched is not None
+                and time.monotonic() - self._fetched[0] < COALESCE_WINDOW_SECONDS
+            ):
+                return self._fetched[1]
+
+            self._inflight = self.hass.async_create_task(self._async_fetch())
+            self._inflight.add_done_callback(self._clear_inflight)
+
+        # Shielded so a cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(self._inflight)
+
+    def _clear_inflight(self, _future: asyncio.Future) -> None:
+        """Forget the completed fetch."""
+        self._inflight = None
+
+    async def _async_fetch(self) -> dict:
+        """Fetch heat pump data from the portal."""
+        # Login to Eplucon if needed
+        if not self.api.is_authenticated:
+            await self.api.login()
+
+        # Fetch heat pump data
+        data = await self.api.get_heat_pump_data()
+        self._fetched = (time.monotonic(), data)
+        return data
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -17,6 +18,12 @@ from .eplucon_api import EpluconAPI, EpluconAuthError, EpluconConnectionError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Minimum number of seconds between two tracebacks of the same error type
+TRACEBACK_LOG_INTERVAL = 60
+
+# Monotonic time of the last logged traceback per error type
+_traceback_logged: dict[str, float] = {}
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_EMAIL): str,
@@ -28,21 +35,36 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _log_unexpected(err: Exception) -> None:
+    """Log an unexpected error, with a traceback at most once per interval."""
+    name = type(err).__name__
+    now = time.monotonic()
+    last = _traceback_logged.get(name)
+
+    if last is None or now - last >= TRACEBACK_LOG_INTERVAL:
+        _traceback_logged[name] = now
+        _LOGGER.exception("Unexpected exception")
+    else:
+        _LOGGER.warning("%s: %s", name, err)
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    api = EpluconAPI(email=data[CONF_EMAIL], password=data[CONF_PASSWORD])
-    
     try:
-        await api.login()
-        # Test if we can fetch data
-        await api.get_heat_pump_data()
-    except EpluconAuthError:
-        raise InvalidAuth
-    except EpluconConnectionError:
-        raise CannotConnect
-    except Exception:  # pylint: disable=broad-except
-        _LOGGER.exception("Unexpected exception")
-        raise CannotConnect
+        async with EpluconAPI(email=data[CONF_EMAIL], password=data[CONF_PASSWORD]) as api:
+            await api.login()
+            # Test if we can fetch data
+            await api.get_heat_pump_data()
+    except Exception as err:  # pylint: disable=broad-except
+        # API errors and the flow errors they map to
+        for api_error, error in (
+            (EpluconAuthError, InvalidAuth),
+            (EpluconConnectionError, CannotConnect),
+        ):
+            if isinstance(err, api_error):
+                raise error from err
+        _log_unexpected(err)
+        raise CannotConnect from err
 
     # Return info that you want to store in the config entry.
     return {"title": f"Eplucon Heat Pump ({data[CONF_EMAIL]})"}
@@ -70,8 +92,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors["base"] = "cannot_connect"
         except InvalidAuth:
             errors["base"] = "invalid_auth"
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception("Unexpected exception")
+        except Exception as err:  # pylint: disable=broad-except
+            _log_unexpected(err)
             errors["base"] = "unknown"
         else:
             return self.async_create_entry(title=info["title"], data=user_input)
@@ -1,4 +1,13 @@
 """Constants for the Eplucon integration."""
+from __future__ import annotations
+
+import sys
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import UnitOfEnergy, UnitOfTemperature
 
 DOMAIN = "eplucon"
 
@@ -12,106 +21,202 @@ DEFAULT_SCAN_INTERVAL = 1  # minutes
 MIN_SCAN_INTERVAL = 1  # minimum 1 minute
 MAX_SCAN_INTERVAL = 60  # maximum 60 minutes
 
-# Sensor types and their properties
-SENSOR_TYPES = {
-    "supply_temperature_1": {
-        "name": "Supply Water Temperature 1",
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-    },
-    "supply_temperature_2": {
-        "name": "Supply Water Temperature 2",
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-    },
-    "source_temperature_1": {
-        "name": "Source Temperature 1",
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-    },
-    "source_temperature_2": {
-        "name": "Source Temperature 2",
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-    },
-    "outdoor_temperature": {
-        "name": "Outdoor Temperature",
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-    },
-    "inside_temperature": {
-        "name": "Inside Temperature",
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-    },
-    "inside_configured_temperature": {
-        "name": "Inside Configured Temperature",
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-    },
-    "hot_water_temperature": {
-        "name": "Hot Water Temperature",
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-    },
-    "hot_water_configured_temperature": {
-        "name": "Hot Water Configured Temperature",
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-    },
-    "power_consumption": {
-        "name": "Power Consumption",
-        "unit": "kWh",
-        "icon": "mdi:flash",
-        "device_class": "energy",
-    },
-    "energy_delivered": {
-        "name": "Energy Delivered",
-        "unit": "kWh",
-        "icon": "mdi:flash",
-        "device_class": "energy",
-    },
-    "cop": {
-        "name": "Coefficient of Performance (SPF)",
-        "unit": None,
-        "icon": "mdi:gauge",
-        "device_class": None,
-    },
-    "operation_mode": {
-        "name": "Operation Mode",
-        "unit": None,
-        "icon": "mdi:heat-pump",
-        "device_class": None,
-    },
-    "heating_mode_status": {
-        "name": "Heating Mode Status",
-        "unit": None,
-        "icon": "mdi:power",
-        "device_class": None,
-    },
-    "dhw_status": {
-        "name": "DHW Status",
-        "unit": None,
-        "icon": "mdi:water-boiler",
-        "device_class": None,
-    },
-    "dg1_status": {
-        "name": "DG1 Status",
-        "unit": None,
-        "icon": "mdi:radiator",
-        "device_class": None,
-    },
+# Update intervals for every selectable number of minutes
+SCAN_INTERVALS: dict[int, timedelta] = {
+    minutes: timedelta(minutes=minutes)
+    for minutes in range(MIN_SCAN_INTERVAL, MAX_SCAN_INTERVAL + 1)
 }
 
+# Relative random deviation applied to every scheduled update
+SCAN_INTERVAL_JITTER = 0.1
+
+# Maximum age of cached data served while the portal is unreachable
+STALE_MAX_SECONDS = 15 * 60
+
+# Window in which concurrent refresh requests share a single portal fetch
+COALESCE_WINDOW_SECONDS = 0.5
+
+# Fraction of the scan interval for which the API client serves cached data
+CACHE_TTL_FACTOR = 0.8
+
+# Persisted data of the last successful fetch
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10 * 60  # seconds, pending saves are flushed on stop
+
+# Sensor definitions: key, name, unit, icon and device class
+_SENSORS = (
+    (
+        "supply_temperature_1",
+        "Supply Water Temperature 1",
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE,
+    ),
+    (
+        "supply_temperature_2",
+        "Supply Water Temperature 2",
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE,
+    ),
+    (
+        "source_temperature_1",
+        "Source Temperature 1",
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE,
+    ),
+    (
+        "source_temperature_2",
+        "Source Temperature 2",
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE,
+    ),
+    (
+        "outdoor_temperature",
+        "Outdoor Temperature",
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE,
+    ),
+    (
+        "inside_temperature",
+        "Inside Temperature",
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE,
+    ),
+    (
+        "inside_configured_temperature",
+        "Inside Configured Temperature",
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE,
+    ),
+    (
+        "hot_water_temperature",
+        "Hot Water Temperature",
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE,
+    ),
+    (
+        "hot_water_configured_temperature",
+        "Hot Water Configured Temperature",
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE,
+    ),
+    (
+        "power_consumption",
+        "Power Consumption",
+        UnitOfEnergy.KILO_WATT_HOUR,
+        "mdi:flash",
+        SensorDeviceClass.ENERGY,
+    ),
+    (
+        "energy_delivered",
+        "Energy Delivered",
+        UnitOfEnergy.KILO_WATT_HOUR,
+        "mdi:flash",
+        SensorDeviceClass.ENERGY,
+    ),
+    (
+        "cop",
+        "Coefficient of Performance (SPF)",
+        None,
+        "mdi:gauge",
+        None,
+    ),
+    (
+        "operation_mode",
+        "Operation Mode",
+        None,
+        "mdi:heat-pump",
+        None,
+    ),
+    (
+        "heating_mode_status",
+        "Heating Mode Status",
+        None,
+        "mdi:power",
+        None,
+    ),
+    (
+        "dhw_status",
+        "DHW Status",
+        None,
+        "mdi:water-boiler",
+        None,
+    ),
+    (
+        "dg1_status",
+        "DG1 Status",
+        None,
+        "mdi:radiator",
+        None,
+    ),
+)
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern a string so lookups by key compare by identity."""
+    return value if value is None else sys.intern(value)
+
+
+# Sensor properties stored as parallel tuples, indexed through SENSOR_INDEX
+SENSOR_KEYS: tuple[str, ...] = tuple(_intern(row[0]) for row in _SENSORS)
+SENSOR_NAMES: tuple[str, ...] = tuple(_intern(row[1]) for row in _SENSORS)
+SENSOR_UNITS: tuple[str | None, ...] = tuple(row[2] for row in _SENSORS)
+SENSOR_ICONS: tuple[str, ...] = tuple(_intern(row[3]) for row in _SENSORS)
+SENSOR_DEVICE_CLASSES: tuple[SensorDeviceClass | None, ...] = tuple(
+    row[4] for row in _SENSORS
+)
+SENSOR_INDEX: Mapping[str, int] = MappingProxyType(
+    {key: index for index, key in enumerate(SENSOR_KEYS)}
+)
+
+
+class SensorMeta(NamedTuple):
+    """Static metadata of a sensor."""
+
+    name: str
+    unit: str | None
+    icon: str
+    device_class: SensorDeviceClass | None
+
+
+_META: dict[str, SensorMeta] = {
+    key: SensorMeta(
+        SENSOR_NAMES[index],
+        SENSOR_UNITS[index],
+        SENSOR_ICONS[index],
+        SENSOR_DEVICE_CLASSES[index],
+    )
+    for index, key in enumerate(SENSOR_KEYS)
+}
+
+# Return the SensorMeta of a sensor key
+get_sensor_meta = _META.__getitem__
+
+
+# Deprecated: read-only dict-of-dicts view of the tables above, kept for
+# backward compatibility. Prefer SENSOR_INDEX and the SENSOR_* tuples.
+SENSOR_TYPES: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        key: MappingProxyType(
+            {
+                "name": SENSOR_NAMES[index],
+                "unit": SENSOR_UNITS[index],
+                "icon": SENSOR_ICONS[index],
+                "device_class": SENSOR_DEVICE_CLASSES[index],
+            }
+        )
+        for index, key in enumerate(SENSOR_KEYS)
+    }
+)
+
 # API endpoints based on actual Eplucon portal
 EPLUCON_BASE_URL = "https://portaal.eplucon.de"
 LOGIN_ENDPOINT = "/login"
@@ -2,18 +2,143 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import re
+import time
+from http.cookies import SimpleCookie
 from typing import Any, Dict
-from urllib.parse import urlencode
 
 import aiohttp
+import lxml.html
 from bs4 import BeautifulSoup
+from lxml import etree
+from yarl import URL
 
 from .const import EPLUCON_BASE_URL, LOGIN_ENDPOINT, DATA_ENDPOINT
 
 _LOGGER = logging.getLogger(__name__)
 
+# account_module_index as a bare 32-character hex string on the heatpump page
+_HEX32_RE = re.compile(rb'\b[a-f0-9]{32}\b')
+# account_module_index referenced as a parameter or data attribute
+_MODULE_IDX_RE = re.compile(
+    rb'(?:account_module_index["\']?\s*[:=]\s*["\']?'
+    rb'|graphicsdata\?account_module_index='
+    rb'|data-account-module-index\s*=\s*["\'])'
+    rb'([a-f0-9]{32})'
+)
+
+# Indicators of a successful or failed login in the login response
+_LOGIN_SUCCESS_RE = re.compile(rb'e-control|heat pump|dashboard|logout|heatpump', re.I)
+_LOGIN_ERROR_RE = re.compile(rb'error|invalid|failed|denied', re.I)
+# Credentials to redact from logged login responses
+_REDACT_PASSWORD_RE = re.compile(r'password["\']?\s*[:=]\s*["\'][^"\']*["\']')
+_REDACT_EMAIL_RE = re.compile(r'email["\']?\s*[:=]\s*["\'][^"\']*["\']')
+# Class attribute of a div that may hold a login error message
+_ERROR_DIV_RE = re.compile(rb'class\s*=\s*["\'][^"\']*\b(?:alert-danger|alert-error|error)\b', re.I)
+# Indicators of a login or error page returned instead of data
+_LOGIN_PAGE_RE = re.compile(rb'login|sign in|password|username', re.I)
+_ERROR_PAGE_RE = re.compile(rb'error|access denied|forbidden|not found|klant|customer', re.I)
+
+# The heatpump page is read in chunks of this size up to the limit
+_HEATPUMP_PAGE_CHUNK_SIZE = 16384
+_HEATPUMP_PAGE_LIMIT = 1024 * 1024
+
+
+def _make_soup(markup: str | bytes, **kwargs: Any) -> BeautifulSoup:
+    """Parse markup with BeautifulSoup using the lxml parser."""
+    return BeautifulSoup(markup, 'lxml', **kwargs)
+
+
+def _element_text(element: lxml.html.HtmlElement) -> str:
+    """Return the stripped text of an element and its descendants."""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+# Value patterns, e.g. "25.5°C" / "25.5 °C", "45 kWh" and plain numbers
+_TEMP_RE = re.compile(r'(-?\d+\.?\d*)\s*°?C?')
+_ENERGY_RE = re.compile(r'(\d+\.?\d*)\s*kWh')
+_FLOAT_RE = re.compile(r'(\d+\.?\d*)')
+
+
+def _extract_temperature(text: str, _search=_TEMP_RE.search) -> float | None:
+    """Extract temperature value from text."""
+    match = _search(text)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            pass
+    return None
+
+
+def _extract_energy(text: str, _search=_ENERGY_RE.search) -> float | None:
+    """Extract energy value from text (kWh)."""
+    match = _search(text)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            pass
+    return None
+
+
+def _extract_float(text: str, _search=_FLOAT_RE.search) -> float | None:
+    """Extract float value from text."""
+    match = _search(text)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            pass
+    return None
+
+
+# Maps the data-type of a pointer div to the data key and its extractor
+_POINTER_MAP = {
+    'aanvoer-1': ('supply_temperature_1', _extract_temperature),
+    'aanvoer-2': ('supply_temperature_2', _extract_temperature),
+    'bron-1': ('source_temperature_1', _extract_temperature),
+    'bron-2': ('source_temperature_2', _extract_temperature),
+    'buitentemp': ('outdoor_temperature', _extract_temperature),
+    'binnen temp.': ('inside_temperature', _extract_temperature),
+    'ingestelde binnen temp. ': ('inside_configured_temperature', _extract_temperature),
+    'W.W. temperatuur.': ('hot_water_temperature', _extract_temperature),
+    'W.W. temperatuur. ingesteld': ('hot_water_configured_temperature', _extract_temperature),
+    'Opgenomen vermogen': ('power_consumption', _extract_energy),
+    'Geleverde energie': ('energy_delivered', _extract_energy),
+    'SPF': ('cop', _extract_float),
+}
+
+
+# Reasonable temperature, energy and COP ranges
+_TEMP_RANGE = (-50, 100)
+_ENERGY_RANGE = (0, 100000)
+_COP_RANGE = (0, 20)
+
+# Data keys with the range of valid values, or None for status values
+# which are kept as text
+_SCHEMA = (
+    ('supply_temperature_1', _TEMP_RANGE),
+    ('supply_temperature_2', _TEMP_RANGE),
+    ('source_temperature_1', _TEMP_RANGE),
+    ('source_temperature_2', _TEMP_RANGE),
+    ('outdoor_temperature', _TEMP_RANGE),
+    ('inside_temperature', _TEMP_RANGE),
+    ('inside_configured_temperature', _TEMP_RANGE),
+    ('hot_water_temperature', _TEMP_RANGE),
+    ('hot_water_configured_temperature', _TEMP_RANGE),
+    ('power_consumption', _ENERGY_RANGE),
+    ('energy_delivered', _ENERGY_RANGE),
+    ('cop', _COP_RANGE),
+    ('operation_mode', None),
+    ('heating_mode_status', None),
+    ('dhw_status', None),
+    ('dg1_status', None),
+)
+
 
 class EpluconAuthError(Exception):
     """Exception to indicate authentication failure."""
@@ -26,28 +151,111 @@ class EpluconConnectionError(Exception):
 class EpluconAPI:
     """API client for Eplucon heat pump data."""
 
-    def __init__(self, email: str, password: str) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        cache_ttl: float = 0.0,
+        account_module_index: str | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        Data fetched within cache_ttl seconds of a previous fetch is served
+        from memory without contacting the portal. A known
+        account_module_index saves looking it up on the heatpump page.
+        """
         self.email = email
         self.password = password
+        self._cache_ttl = cache_ttl
+        self._cache: tuple[float, Dict[str, Any]] | None = None
         self.session: aiohttp.ClientSession | None = None
         self.is_authenticated = False
-        self._account_module_index: str | None = None
+        self._account_module_index = account_module_index
+        # Whether the index was handed in and not yet confirmed on the portal
+        self._module_index_restored = account_module_index is not None
+
+        # Conditional request state of the last successful data fetch
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._body_digest: bytes | None = None
+        self._last_data: Dict[str, Any] | None = None
+
+        # Data URL and the account module index it was built for
+        self._data_url_for: tuple[str, URL] | None = None
+
+        # Persisted cookies to load into the next session
+        self._restored_cookies: list[dict[str, str]] = []
         
         # Initialize the API client
         _LOGGER.debug("Eplucon API initialized")
 
+    @property
+    def account_module_index(self) -> str | None:
+        """Return the account module index of the heat pump, if known."""
+        return self._account_module_index
+
+    @account_module_index.setter
+    def account_module_index(self, value: str | None) -> None:
+        """Set a previously found account module index."""
+        self._account_module_index = value
+        self._module_index_restored = value is not None
+
+    def export_cookies(self) -> list[dict[str, str]]:
+        """Return the cookies of the current session for persisting."""
+        if self.session is None:
+            return []
+        return [
+            {
+                "name": morsel.key,
+                "value": morsel.value,
+                "domain": morsel["domain"],
+                "path": morsel["path"],
+            }
+            for morsel in self.session.cookie_jar
+        ]
+
+    def restore_cookies(self, cookies: list[dict[str, str]]) -> None:
+        """Continue a persisted session instead of logging in again.
+
+        Data requests rejected for an expired session still fall back to a
+        full login.
+        """
+        self._restored_cookies = cookies
+        self.is_authenticated = bool(cookies)
+
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure we have an active session."""
         if self.session is None or self.session.closed:
+            # One pooled, keep-alive session is reused for all portal requests
             self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=4, limit_per_host=4, keepalive_timeout=90, ttl_dns_cache=600
+                ),
                 timeout=aiohttp.ClientTimeout(total=30),
                 headers={
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+                    "Referer": f"{EPLUCON_BASE_URL}/e-control/heatpump",
                 }
             )
+
+            for cookie in self._restored_cookies:
+                morsels = SimpleCookie()
+                morsels[cookie["name"]] = cookie["value"]
+                morsels[cookie["name"]]["domain"] = cookie["domain"]
+                morsels[cookie["name"]]["path"] = cookie["path"]
+                self.session.cookie_jar.update_cookies(morsels, URL(EPLUCON_BASE_URL))
+            self._restored_cookies = []
         return self.session
 
+    async def __aenter__(self) -> EpluconAPI:
+        """Open the session for use as an async context manager."""
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the session when leaving the context."""
+        await self.close()
+
     async def login(self) -> bool:
         """Login to Eplucon portal."""
         _LOGGER.info("Starting login process")
@@ -56,35 +264,36 @@ class EpluconAPI:
         try:
             # First, get the login page to extract CSRF token
             login_url = f"{EPLUCON_BASE_URL}{LOGIN_ENDPOINT}"
-            _LOGGER.debug(f"Attempting to load login page: {login_url}")
+            _LOGGER.debug("Attempting to load login page: %s", login_url)
             
             async with session.get(login_url) as response:
-                _LOGGER.debug(f"Login page response status: {response.status}")
-                _LOGGER.debug(f"Login page response headers: {dict(response.headers)}")
+                _LOGGER.debug("Login page response status: %s", response.status)
+                _LOGGER.debug("Login page response headers: %s", response.headers)
                 
                 if response.status != 200:
                     raise EpluconConnectionError(f"Failed to load login page: {response.status}")
                 
-                login_page_content = await response.text()
-                _LOGGER.debug(f"Login page content length: {len(login_page_content)} characters")
+                login_page_content = await response.read()
+                _LOGGER.debug("Login page content length: %s bytes", len(login_page_content))
                 
                 # Parse the login page first
                 try:
-                    soup = BeautifulSoup(login_page_content, 'html.parser')
+                    soup = _make_soup(login_page_content, from_encoding=response.charset or 'utf-8')
                 except Exception as e:
-                    _LOGGER.error(f"Failed to parse login page HTML: {e}")
+                    _LOGGER.error("Failed to parse login page HTML: %s", e)
                     raise EpluconConnectionError(f"Failed to parse login page: {e}")
                 
                 # Log login page structure for debugging
-                try:
-                    _LOGGER.debug(f"Login page contains {len(re.findall(r'<input', login_page_content))} input fields")
-                    _LOGGER.debug(f"Login page forms: {len(soup.find_all('form'))}")
-                    if soup.find('input', {'name': '_token'}):
-                        _LOGGER.debug("CSRF token field found in login page")
-                    else:
-                        _LOGGER.debug("No CSRF token field found in login page")
-                except Exception as e:
-                    _LOGGER.debug(f"Error analyzing login page structure: {e}")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    try:
+                        _LOGGER.debug("Login page contains %s input fields", len(soup.find_all('input')))
+                        _LOGGER.debug("Login page forms: %s", len(soup.find_all('form')))
+                        if soup.find('input', {'name': '_token'}):
+                            _LOGGER.debug("CSRF token field found in login page")
+                        else:
+                            _LOGGER.debug("No CSRF token field found in login page")
+                    except Exception as e:
+                        _LOGGER.debug("Error analyzing login page structure: %s", e)
                 
                 # Extract CSRF token
                 csrf_token = None
@@ -100,14 +309,15 @@ class EpluconAPI:
                         token_input = soup.find('input', {'name': token_name})
                         if token_input:
                             csrf_token = token_input.get('value')
-                            _LOGGER.debug(f"Found alternative token field: {token_name}")
+                            _LOGGER.debug("Found alternative token field: %s", token_name)
                             break
                 
                 if not csrf_token:
                     _LOGGER.error("Could not find any CSRF token on login page")
                     # List all input fields for debugging
-                    all_inputs = soup.find_all('input')
-                    _LOGGER.debug(f"All input fields found: {[(inp.get('name'), inp.get('type')) for inp in all_inputs]}")
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        all_inputs = soup.find_all('input')
+                        _LOGGER.debug("All input fields found: %s", [(inp.get('name'), inp.get('type')) for inp in all_inputs])
                     raise EpluconAuthError("Could not find CSRF token on login page")
 
                 # Prepare login form data
@@ -116,69 +326,76 @@ class EpluconAPI:
                     'username': self.email,
                     'password': self.password,
                 }
-                _LOGGER.debug(f"Prepared login form data with fields: {list(form_data.keys())}")
+                _LOGGER.debug("Prepared login form data with fields: %s", form_data.keys())
 
             # Submit login form
-            _LOGGER.debug(f"Submitting login form to: {login_url}")
+            _LOGGER.debug("Submitting login form to: %s", login_url)
             async with session.post(login_url, data=form_data, allow_redirects=True) as response:
-                _LOGGER.debug(f"Login form submission response status: {response.status}")
-                _LOGGER.debug(f"Login response headers: {dict(response.headers)}")
-                _LOGGER.debug(f"Final URL after redirects: {response.url}")
+                _LOGGER.debug("Login form submission response status: %s", response.status)
+                _LOGGER.debug("Login response headers: %s", response.headers)
+                _LOGGER.debug("Final URL after redirects: %s", response.url)
                 
                 if response.status == 200:
-                    response_text = await response.text()
-                    _LOGGER.debug(f"Login response content length: {len(response_text)} characters")
-                    
-                    # Log login response structure for debugging
-                    _LOGGER.debug(f"Login response contains: forms={len(BeautifulSoup(response_text, 'html.parser').find_all('form'))}")
-                    _LOGGER.debug(f"Login response URL path: {response.url.path}")
-                    _LOGGER.debug(f"Login response title: {BeautifulSoup(response_text, 'html.parser').find('title')}")
+                    response_body = await response.read()
+                    _LOGGER.debug("Login response content length: %s bytes", len(response_body))
                     
-                    # Log first 500 chars of response (without sensitive data)
-                    safe_response = re.sub(r'password["\']?\s*[:=]\s*["\'][^"\']*["\']', 'password: [REDACTED]', response_text[:500])
-                    safe_response = re.sub(r'email["\']?\s*[:=]\s*["\'][^"\']*["\']', 'email: [REDACTED]', safe_response)
-                    _LOGGER.debug(f"Login response snippet: {safe_response}")
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        # Log login response structure for debugging
+                        response_text = await response.text()
+                        response_soup = _make_soup(response_text)
+                        _LOGGER.debug("Login response contains: forms=%s", len(response_soup.find_all('form')))
+                        _LOGGER.debug("Login response URL path: %s", response.url.path)
+                        _LOGGER.debug("Login response title: %s", response_soup.find('title'))
+                        
+                        # Log first 500 chars of response (without sensitive data)
+                        safe_response = _REDACT_PASSWORD_RE.sub('password: [REDACTED]', response_text[:500])
+                        safe_response = _REDACT_EMAIL_RE.sub('email: [REDACTED]', safe_response)
+                        _LOGGER.debug("Login response snippet: %s", safe_response)
                     
                     # Log potential success/error indicators
-                    error_indicators = ["error", "invalid", "failed", "denied"]
-                    found_errors = [err for err in error_indicators if err in response_text.lower()]
-                    if found_errors:
-                        _LOGGER.warning(f"Error indicators found in response: {found_errors}")
+                    found_error = _LOGIN_ERROR_RE.search(response_body)
+                    if found_error:
+                        _LOGGER.warning("Error indicator found in response: %s", found_error.group(0))
                     
                     # Check if login was successful - look for dashboard indicators
-                    success_indicators = ["e-control", "heat pump", "dashboard", "logout", "heatpump"]
-                    found_indicators = [indicator for indicator in success_indicators if indicator in response_text.lower()]
-                    _LOGGER.info(f"Success indicators found: {found_indicators}")
+                    found_indicator = _LOGIN_SUCCESS_RE.search(response_body)
+                    _LOGGER.info("Success indicator found: %s", found_indicator and found_indicator.group(0))
                     
-                    if found_indicators:
+                    if found_indicator:
                         self.is_authenticated = True
                         _LOGGER.info("Login appears successful based on page content indicators")
                         
                         # Navigate directly to heatpump page to find the account_module_index
-                        _LOGGER.debug("Navigating to heatpump page to find account_module_index")
-                        await self._find_module_index_from_heatpump_page(session)
+                        if self._account_module_index is None:
+                            _LOGGER.debug("Navigating to heatpump page to find account_module_index")
+                            await self._find_module_index_from_heatpump_page(session)
                         
                         return True
                     else:
                         _LOGGER.error("Login failed - no success indicators found in response")
+                        # Only parse the response if it has an error div at all
+                        if not _ERROR_DIV_RE.search(response_body):
+                            _LOGGER.error("No specific error messages found, but login appears to have failed")
+                            raise EpluconAuthError("Invalid credentials or login failed")
+
                         # Check for error messages in the response
                         try:
-                            soup = BeautifulSoup(response_text, 'html.parser')
+                            soup = _make_soup(response_body, from_encoding=response.charset or 'utf-8')
                             error_divs = soup.find_all('div', class_=['alert-danger', 'error', 'alert-error'])
                             error_messages = [div.get_text(strip=True) for div in error_divs if div.get_text(strip=True)]
                             if error_messages:
-                                _LOGGER.error(f"Found error messages: {error_messages}")
+                                _LOGGER.error("Found error messages: %s", error_messages)
                                 raise EpluconAuthError(f"Login failed with errors: {'; '.join(error_messages)}")
                             else:
                                 _LOGGER.error("No specific error messages found, but login appears to have failed")
                                 raise EpluconAuthError("Invalid credentials or login failed")
                         except Exception as parse_error:
-                            _LOGGER.debug(f"Could not parse error messages from response: {parse_error}")
+                            _LOGGER.debug("Could not parse error messages from response: %s", parse_error)
                             raise EpluconAuthError("Invalid credentials or login failed")
                 else:
-                    _LOGGER.error(f"Login failed with HTTP status: {response.status}")
+                    _LOGGER.error("Login failed with HTTP status: %s", response.status)
                     response_text = await response.text()
-                    _LOGGER.debug(f"Error response content: {response_text[:500]}...")
+                    _LOGGER.debug("Error response content: %s...", response_text[:500])
                     raise EpluconConnectionError(f"Login failed with status: {response.status}")
                     
         except aiohttp.ClientError as err:
@@ -188,6 +405,18 @@ class EpluconAPI:
             raise EpluconConnectionError(f"Unexpected error: {err}")
 
     async def get_heat_pump_data(self) -> Dict[str, Any]:
+        """Return heat pump data, served from cache while it is fresh."""
+        if self._cache is not None:
+            timestamp, data = self._cache
+            if time.monotonic() - timestamp < self._cache_ttl:
+                _LOGGER.debug("Serving heat pump data from cache")
+                return data
+
+        data = await self._fetch_heat_pump_data()
+        self._cache = (time.monotonic(), data)
+        return data
+
+    async def _fetch_heat_pump_data(self) -> Dict[str, Any]:
         """Fetch heat pump data from Eplucon portal."""
         _LOGGER.debug("Starting heat pump data retrieval")
         
@@ -195,7 +424,7 @@ class EpluconAPI:
             _LOGGER.info("Not authenticated, attempting login first")
             await self.login()
 
-        _LOGGER.debug(f"Account Module Index: {self._account_module_index}")
+        _LOGGER.debug("Account Module Index: %s", self._account_module_index)
         if not self._account_module_index:
             # Try to re-authenticate and find the module index
             _LOGGER.warning("No account module index available, attempting re-authentication")
@@ -210,180 +439,233 @@ class EpluconAPI:
         
         try:
             # Construct the graphicsdata URL with the account module index
-            params = {'account_module_index': self._account_module_index}
-            data_url = f"{EPLUCON_BASE_URL}{DATA_ENDPOINT}?{urlencode(params)}"
-            _LOGGER.debug(f"Fetching data from: {data_url}")
+            data_url = self._data_url()
+            _LOGGER.debug("Fetching data from: %s", data_url)
             
             # Add headers that might be expected for AJAX requests
             headers = {
                 'X-Requested-With': 'XMLHttpRequest',
                 'Accept': 'application/json, text/javascript, */*; q=0.01',
-                'Referer': f"{EPLUCON_BASE_URL}/e-control/heatpump"
             }
-            _LOGGER.debug(f"Using headers: {headers}")
+            if self._last_data is not None:
+                if self._etag:
+                    headers['If-None-Match'] = self._etag
+                if self._last_modified:
+                    headers['If-Modified-Since'] = self._last_modified
+            _LOGGER.debug("Using headers: %s", headers)
             
-            async with session.get(data_url, headers=headers) as response:
-                _LOGGER.debug(f"Data request response status: {response.status}")
-                _LOGGER.debug(f"Data response headers: {dict(response.headers)}")
-                
-                if response.status == 401 or response.status == 403:
-                    # Session expired, try to re-authenticate
-                    _LOGGER.warning("Session expired (401/403), attempting re-authentication")
-                    self.is_authenticated = False
-                    await self.login()
-                    
-                    # Retry with new session
-                    params = {'account_module_index': self._account_module_index}
-                    data_url = f"{EPLUCON_BASE_URL}{DATA_ENDPOINT}?{urlencode(params)}"
-                    _LOGGER.info(f"Retrying data fetch after re-auth: {data_url}")
-                    async with session.get(data_url, headers=headers) as retry_response:
-                        if retry_response.status != 200:
-                            _LOGGER.error(f"Failed to fetch data after re-auth: {retry_response.status}")
-                            raise EpluconConnectionError(f"Failed to fetch data after re-auth: {retry_response.status}")
-                        response = retry_response
-                elif response.status != 200:
-                    _LOGGER.error(f"Failed to fetch data: {response.status}")
-                    response_text = await response.text()
-                    _LOGGER.debug(f"Error response content: {response_text[:500]}...")
-                    raise EpluconConnectionError(f"Failed to fetch data: {response.status}")
+            if self._module_index_restored:
+                # A restored index is most likely still valid, so confirm it
+                # on the heatpump page while its data is already requested
+                self._module_index_restored = False
+                restored_index = self._account_module_index
+                _, response = await asyncio.gather(
+                    self._find_module_index_from_heatpump_page(session),
+                    self._get_data_response(session, data_url, headers),
+                )
+                if self._account_module_index != restored_index:
+                    data_url = self._data_url()
+                    _LOGGER.info("Account module index changed, retrying data fetch: %s", data_url)
+                    response = await self._get_data_response(session, data_url, headers)
+            else:
+                response = await self._get_data_response(session, data_url, headers)
 
-                # Parse JSON response containing HTML
-                _LOGGER.debug("Parsing response data")
-                content_type = response.headers.get('content-type', '')
-                _LOGGER.debug(f"Response content type: {content_type}")
-                
-                try:
-                    if 'application/json' in content_type:
-                        json_data = await response.json()
-                        _LOGGER.debug(f"JSON response keys: {list(json_data.keys())}")
-                        html_content = json_data.get('html', '')
-                    elif 'text/html' in content_type:
-                        # The endpoint returned HTML directly instead of JSON
-                        _LOGGER.warning("Data endpoint returned HTML instead of JSON - this might indicate authentication issues or wrong endpoint")
-                        html_content = await response.text()
-                        _LOGGER.info(f"Direct HTML response length: {len(html_content)} characters")
-                        
-                        # Check if this is actually the login page or an error page
-                        if any(indicator in html_content.lower() for indicator in ["login", "sign in", "password", "username"]):
-                            _LOGGER.error("Received login page instead of data - session may have expired")
-                            raise EpluconConnectionError("Session expired - received login page instead of data")
+            _LOGGER.debug("Data request response status: %s", response.status)
+            _LOGGER.debug("Data response headers: %s", response.headers)
+            
+            if response.status == 401 or response.status == 403:
+                # The session cookies are often still valid, retry them once
+                _LOGGER.warning("Data request returned %s, retrying with current session", response.status)
+                response = await self._get_data_response(session, data_url, headers)
+
+            if await self._login_required(response):
+                # Session expired, try to re-authenticate
+                _LOGGER.warning("Session expired, attempting re-authentication")
+                self.is_authenticated = False
+                await self.login()
+
+                # Retry with new session
+                data_url = self._data_url()
+                _LOGGER.info("Retrying data fetch after re-auth: %s", data_url)
+                response = await self._get_data_response(session, data_url, headers)
+
+            if response.status == 304 and self._last_data is not None:
+                _LOGGER.debug("Data not modified since last fetch, using cached data")
+                return self._last_data
+            elif response.status != 200:
+                _LOGGER.error("Failed to fetch data: %s", response.status)
+                body = await response.read()
+                _LOGGER.debug("Error response content: %s...", body[:500])
+                raise EpluconConnectionError(f"Failed to fetch data: {response.status}")
+
+            # Skip parsing entirely if the portal sent the same payload again
+            body = await response.read()
+            body_digest = hashlib.blake2b(body, digest_size=16).digest()
+            if body_digest == self._body_digest and self._last_data is not None:
+                _LOGGER.debug("Data response unchanged since last fetch, using cached data")
+                return self._last_data
+
+            # Parse JSON response containing HTML
+            _LOGGER.debug("Parsing response data")
+            content_type = response.headers.get('content-type', '')
+            _LOGGER.debug("Response content type: %s", content_type)
+            
+            try:
+                if 'application/json' in content_type:
+                    json_data = json.loads(body)
+                    _LOGGER.debug("JSON response keys: %s", json_data.keys())
+                    html_content = json_data.get('html', '')
+                elif 'text/html' in content_type:
+                    # The endpoint returned HTML directly instead of JSON
+                    _LOGGER.warning("Data endpoint returned HTML instead of JSON - this might indicate authentication issues or wrong endpoint")
+                    html_content = body.decode(response.charset or 'utf-8', errors='replace')
+                    _LOGGER.info("Direct HTML response length: %s characters", len(html_content))
+                    
+                    # Check if this is actually the login page or an error page
+                    if _LOGIN_PAGE_RE.search(body):
+                        _LOGGER.error("Received login page instead of data - session may have expired")
+                        raise EpluconConnectionError("Session expired - received login page instead of data")
+                    
+                    # Check if this is an error page
+                    if _ERROR_PAGE_RE.search(body):
+                        _LOGGER.error("Received error/customer page instead of data")
+                        soup_error = _make_soup(html_content)
+                        error_title = soup_error.find('title')
+                        error_msg = error_title.get_text(strip=True) if error_title else "Unknown error"
                         
-                        # Check if this is an error page
-                        if any(indicator in html_content.lower() for indicator in ["error", "access denied", "forbidden", "not found", "klant", "customer"]):
-                            _LOGGER.error("Received error/customer page instead of data")
-                            soup_error = BeautifulSoup(html_content, 'html.parser')
-                            error_title = soup_error.find('title')
-                            error_msg = error_title.get_text(strip=True) if error_title else "Unknown error"
-                            
-                            # This suggests we need to find the correct module index
-                            _LOGGER.error(f"Data request failed with: {error_msg}")
-                            _LOGGER.error("This usually means the account_module_index is missing or incorrect")
-                            
-                            raise EpluconConnectionError(f"Data request failed: {error_msg} - account_module_index may be incorrect")
-                    else:
-                        _LOGGER.error(f"Unexpected content type: {content_type}")
-                        response_text = await response.text()
-                        _LOGGER.debug(f"Response content: {response_text[:500]}...")
-                        raise EpluconConnectionError(f"Unexpected content type: {content_type}")
+                        # This suggests we need to find the correct module index
+                        _LOGGER.error("Data request failed with: %s", error_msg)
+                        _LOGGER.error("This usually means the account_module_index is missing or incorrect")
+
+                        # Look the index up again on the next login
+                        self._account_module_index = None
+                        self.is_authenticated = False
                         
-                except Exception as e:
-                    if "Invalid JSON response" in str(e):
-                        raise  # Re-raise our own exceptions
-                    _LOGGER.error(f"Failed to parse response: {e}")
-                    response_text = await response.text()
-                    _LOGGER.debug(f"Response content: {response_text[:500]}...")
-                    raise EpluconConnectionError(f"Failed to parse response: {e}")
-                
-                _LOGGER.info(f"HTML content length: {len(html_content)} characters")
-                
-                if not html_content:
-                    _LOGGER.error("No HTML content found in JSON response")
-                    _LOGGER.debug(f"Full JSON response: {json_data}")
-                    raise EpluconConnectionError("No HTML content found in response")
+                        raise EpluconConnectionError(f"Data request failed: {error_msg} - account_module_index may be incorrect")
+                else:
+                    _LOGGER.error("Unexpected content type: %s", content_type)
+                    _LOGGER.debug("Response content: %s...", body[:500])
+                    raise EpluconConnectionError(f"Unexpected content type: {content_type}")
+                    
+            except Exception as e:
+                if "Invalid JSON response" in str(e):
+                    raise  # Re-raise our own exceptions
+                _LOGGER.error("Failed to parse response: %s", e)
+                _LOGGER.debug("Response content: %s...", body[:500])
+                raise EpluconConnectionError(f"Failed to parse response: {e}")
+            
+            _LOGGER.debug("HTML content length: %s characters", len(html_content))
+            
+            if not html_content:
+                _LOGGER.error("No HTML content found in JSON response")
+                _LOGGER.debug("Full JSON response: %s", json_data)
+                raise EpluconConnectionError("No HTML content found in response")
 
-                # Log data response structure instead of saving file
-                _LOGGER.debug(f"Data response content type: {response.headers.get('content-type', 'unknown')}")
-                try:
-                    soup_preview = BeautifulSoup(html_content, 'html.parser')
-                    _LOGGER.debug(f"HTML content has {len(soup_preview.find_all('div'))} div elements")
-                    _LOGGER.debug(f"HTML content snippet: {html_content[:200]}...")
-                except Exception as e:
-                    _LOGGER.debug(f"Could not parse HTML preview: {e}")
-                    _LOGGER.debug(f"Raw HTML snippet: {html_content[:200]}...")
+            # Log data response structure instead of saving file
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Data response content type: %s", content_type)
+                _LOGGER.debug("HTML content has %s div elements", html_content.count('<div'))
+                _LOGGER.debug("HTML content snippet: %s...", html_content[:200])
 
-                # Parse the HTML data to extract sensor values
-                _LOGGER.info("Parsing HTML data to extract sensor values")
-                data = self._parse_html_data(html_content)
-                _LOGGER.info(f"Extracted {len(data)} raw data points: {list(data.keys())}")
-                
-                normalized_data = self._normalize_data(data)
-                _LOGGER.info(f"Normalized to {len(normalized_data)} valid data points: {list(normalized_data.keys())}")
-                
-                return normalized_data
-                
+            # Parse the HTML data to extract sensor values
+            _LOGGER.debug("Parsing HTML data to extract sensor values")
+            data = self._parse_html_data(html_content)
+            _LOGGER.debug("Extracted %s raw data points: %s", len(data), data.keys())
+            
+            normalized_data = self._normalize_data(data)
+            _LOGGER.debug("Normalized to %s valid data points: %s", len(normalized_data), normalized_data.keys())
+
+            # Remember validators for the next conditional request
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+            self._body_digest = body_digest
+            self._last_data = normalized_data
+            
+            return normalized_data
+            
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Connection error while fetching data: {err}")
+            _LOGGER.error("Connection error while fetching data: %s", err)
             raise EpluconConnectionError(f"Connection error while fetching data: {err}")
         except Exception as err:
-            _LOGGER.error(f"Unexpected error while fetching data: {err}")
-            import traceback
-            _LOGGER.debug(f"Data fetch traceback: {traceback.format_exc()}")
+            _LOGGER.error("Unexpected error while fetching data: %s", err)
+            _LOGGER.debug("Data fetch traceback", exc_info=True)
             raise
 
+    def _data_url(self) -> URL:
+        """Return the graphicsdata URL for the account module index."""
+        index = self._account_module_index
+        if self._data_url_for is None or self._data_url_for[0] != index:
+            url = URL(f"{EPLUCON_BASE_URL}{DATA_ENDPOINT}").with_query(account_module_index=index)
+            self._data_url_for = (index, url)
+        return self._data_url_for[1]
+
+    @staticmethod
+    async def _login_required(response: aiohttp.ClientResponse) -> bool:
+        """Return whether a data response was rejected for lack of a session."""
+        if response.status == 401 or response.status == 403:
+            return True
+        return (
+            response.status == 200
+            and 'text/html' in response.headers.get('content-type', '')
+            and _LOGIN_PAGE_RE.search(await response.read()) is not None
+        )
+
+    async def _get_data_response(
+        self, session: aiohttp.ClientSession, data_url: URL, headers: Dict[str, str]
+    ) -> aiohttp.ClientResponse:
+        """Request the data URL and read the full response body.
+
+        Reading the body returns the connection to the pool while keeping
+        the body available to text() and json().
+        """
+        response = await session.get(data_url, headers=headers)
+        try:
+            await response.read()
+        except BaseException:
+            # Do not keep the connection checked out until garbage collection
+            response.release()
+            raise
+        return response
+
     def _parse_html_data(self, html_content: str) -> Dict[str, Any]:
         """Parse heat pump data from HTML content."""
-        soup = BeautifulSoup(html_content, 'html.parser')
         data = {}
-        
-        # Extract temperature values from pointer elements
-        pointers = soup.find_all('div', class_='pointer')
-        for pointer in pointers:
-            data_type = pointer.get('data-type', '')
-            text = pointer.get_text(strip=True)
-            
-            if data_type == 'aanvoer-1':
-                data['supply_temperature_1'] = self._extract_temperature(text)
-            elif data_type == 'aanvoer-2':
-                data['supply_temperature_2'] = self._extract_temperature(text)
-            elif data_type == 'bron-1':
-                data['source_temperature_1'] = self._extract_temperature(text)
-            elif data_type == 'bron-2':
-                data['source_temperature_2'] = self._extract_temperature(text)
-            elif data_type == 'buitentemp':
-                data['outdoor_temperature'] = self._extract_temperature(text)
-            elif data_type == 'binnen temp.':
-                data['inside_temperature'] = self._extract_temperature(text)
-            elif data_type == 'ingestelde binnen temp. ':
-                data['inside_configured_temperature'] = self._extract_temperature(text)
-            elif data_type == 'W.W. temperatuur.':
-                data['hot_water_temperature'] = self._extract_temperature(text)
-            elif data_type == 'W.W. temperatuur. ingesteld':
-                data['hot_water_configured_temperature'] = self._extract_temperature(text)
-            elif data_type == 'Opgenomen vermogen':
-                data['power_consumption'] = self._extract_energy(text)
-            elif data_type == 'Geleverde energie':
-                data['energy_delivered'] = self._extract_energy(text)
-            elif data_type == 'SPF':
-                data['cop'] = self._extract_float(text)
+        try:
+            root = lxml.html.fromstring(html_content)
+        except etree.ParserError:
+            return data
+
+        # Walk the divs once, handling pointers as they come and keeping
+        # the first div of each element class for afterwards
+        elements = {}
+        for div in root.iter('div'):
+            classes = div.get('class', '').split()
+            if 'pointer' in classes:
+                # Extract temperature values from pointer elements
+                entry = _POINTER_MAP.get(div.get('data-type', ''))
+                if entry:
+                    key, extract = entry
+                    data[key] = extract(_element_text(div))
+            if 'element' in classes:
+                elements.setdefault(' '.join(classes), div)
         
         # Extract operation mode
-        operation_mode_elem = soup.find('div', class_='element operation-mode')
-        if operation_mode_elem:
-            data['operation_mode'] = operation_mode_elem.get_text(strip=True)
+        operation_mode_elem = elements.get('element operation-mode')
+        if operation_mode_elem is not None:
+            data['operation_mode'] = _element_text(operation_mode_elem)
         
         # Extract heating mode status
-        heating_mode_elem = soup.find('div', class_='element heating-mode')
-        if heating_mode_elem:
+        heating_mode_elem = elements.get('element heating-mode')
+        if heating_mode_elem is not None:
             title = heating_mode_elem.get('title', '')
             data['heating_mode_status'] = title.strip()
         
         # Extract DGS status information
-        dgs_elem = soup.find('div', class_='element dgs')
-        if dgs_elem:
-            spans = dgs_elem.find_all('span')
-            for span in spans:
-                span_text = span.get_text(strip=True)
-                classes = span.get('class', [])
+        dgs_elem = elements.get('element dgs')
+        if dgs_elem is not None:
+            for span in dgs_elem.iter('span'):
+                span_text = _element_text(span)
+                classes = span.get('class', '').split()
                 status = 'ON' if 'on' in classes else 'OFF'
                 
                 if span_text == 'dhw':
@@ -392,89 +674,28 @@ class EpluconAPI:
                     data['dg1_status'] = status
         
         # Extract inside temperature from element class
-        inside_temp_elem = soup.find('div', class_='element inside-temp')
-        if inside_temp_elem and 'inside_temperature' not in data:
-            data['inside_temperature'] = self._extract_temperature(inside_temp_elem.get_text(strip=True))
+        inside_temp_elem = elements.get('element inside-temp')
+        if inside_temp_elem is not None and 'inside_temperature' not in data:
+            data['inside_temperature'] = _extract_temperature(_element_text(inside_temp_elem))
         
         # Extract configured inside temperature from element class
-        inside_config_elem = soup.find('div', class_='element inside-configured-temp')
-        if inside_config_elem and 'inside_configured_temperature' not in data:
-            data['inside_configured_temperature'] = self._extract_temperature(inside_config_elem.get_text(strip=True))
+        inside_config_elem = elements.get('element inside-configured-temp')
+        if inside_config_elem is not None and 'inside_configured_temperature' not in data:
+            data['inside_configured_temperature'] = _extract_temperature(_element_text(inside_config_elem))
         
         return data
 
-    def _extract_temperature(self, text: str) -> float | None:
-        """Extract temperature value from text."""
-        # Look for temperature patterns like "25.5°C" or "25.5 °C"
-        match = re.search(r'(-?\d+\.?\d*)\s*°?C?', text)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:
-                pass
-        return None
-
-    def _extract_energy(self, text: str) -> float | None:
-        """Extract energy value from text (kWh)."""
-        # Look for energy patterns like "45 kWh"
-        match = re.search(r'(\d+\.?\d*)\s*kWh', text)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:
-                pass
-        return None
-
-    def _extract_float(self, text: str) -> float | None:
-        """Extract float value from text."""
-        match = re.search(r'(\d+\.?\d*)', text)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:
-                pass
-        return None
-
     def _normalize_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize and validate the data."""
         normalized = {}
-        
-        # Temperature sensors - validate reasonable ranges
-        temp_sensors = [
-            'supply_temperature_1', 'supply_temperature_2',
-            'source_temperature_1', 'source_temperature_2',
-            'outdoor_temperature', 'inside_temperature',
-            'inside_configured_temperature', 'hot_water_temperature',
-            'hot_water_configured_temperature'
-        ]
-        
-        for key in temp_sensors:
-            value = raw_data.get(key)
-            if value is not None and isinstance(value, (int, float)):
-                if -50 <= value <= 100:  # Reasonable temperature range
-                    normalized[key] = value
-        
-        # Energy sensors
-        energy_sensors = ['power_consumption', 'energy_delivered']
-        for key in energy_sensors:
-            value = raw_data.get(key)
-            if value is not None and isinstance(value, (int, float)):
-                if 0 <= value <= 100000:  # Reasonable energy range
-                    normalized[key] = value
-        
-        # COP/SPF
-        cop_value = raw_data.get('cop')
-        if cop_value is not None and isinstance(cop_value, (int, float)):
-            if 0 <= cop_value <= 20:  # Reasonable COP range
-                normalized['cop'] = cop_value
-        
-        # Status values
-        status_keys = ['operation_mode', 'heating_mode_status', 'dhw_status', 'dg1_status']
-        for key in status_keys:
+        for key, valid_range in _SCHEMA:
             value = raw_data.get(key)
-            if value is not None:
+            if value is None:
+                continue
+            if valid_range is None:
                 normalized[key] = str(value)
-        
+            elif isinstance(value, (int, float)) and valid_range[0] <= value <= valid_range[1]:
+                normalized[key] = value
         return normalized
 
     async def close(self) -> None:
@@ -483,7 +704,11 @@ class EpluconAPI:
             await self.session.close()
             self.session = None
         self.is_authenticated = False
-        self._account_module_index = None
+        self._etag = None
+        self._last_modified = None
+        self._body_digest = None
+        self._last_data = None
+        self._cache = None
 
     async def _find_module_index_from_heatpump_page(self, session: aiohttp.ClientSession) -> None:
         """Find the account_module_index by browsing to the heatpump page."""
@@ -492,50 +717,55 @@ class EpluconAPI:
             
             # Navigate directly to the heatpump page
             heatpump_url = f"{EPLUCON_BASE_URL}/e-control/heatpump"
-            _LOGGER.debug(f"Loading heatpump page: {heatpump_url}")
+            _LOGGER.debug("Loading heatpump page: %s", heatpump_url)
             
             async with session.get(heatpump_url) as response:
-                _LOGGER.debug(f"Heatpump page response status: {response.status}")
-                _LOGGER.debug(f"Final URL after redirects: {response.url}")
+                _LOGGER.debug("Heatpump page response status: %s", response.status)
+                _LOGGER.debug("Final URL after redirects: %s", response.url)
                 
-                if response.status == 200:
-                    content = await response.text()
-                    _LOGGER.debug(f"Heatpump page content length: {len(content)} characters")
+                if response.url.path == LOGIN_ENDPOINT:
+                    # An expired session is redirected to the login page
+                    _LOGGER.warning("Heatpump page redirected to login, session has expired")
+                elif response.status == 200:
+                    # Search for a 32-char hex string (account_module_index format)
+                    # while the page streams in, stopping at the first one
+                    content = bytearray()
+                    match = None
+                    async for chunk in response.content.iter_chunked(_HEATPUMP_PAGE_CHUNK_SIZE):
+                        # Rescan the tail of the previous chunk for a split match
+                        start = max(0, len(content) - 32)
+                        content.extend(chunk)
+                        match = _HEX32_RE.search(content, start)
+                        # A match ending at the buffer end may go on in the next chunk
+                        if match and match.end() < len(content):
+                            break
+                        if len(content) >= _HEATPUMP_PAGE_LIMIT:
+                            break
+                    _LOGGER.debug("Heatpump page content read: %s bytes", len(content))
                     
-                    # Search for 32-character hex strings (account_module_index format)
-                    hex_32_patterns = re.findall(r'\b([a-f0-9]{32})\b', content)
-                    if hex_32_patterns:
-                        _LOGGER.info(f"Found 32-char hex patterns: {hex_32_patterns}")
-                        self._account_module_index = hex_32_patterns[0]
-                        _LOGGER.info(f"Using account_module_index: {self._account_module_index}")
+                    if match:
+                        self._account_module_index = match.group(0).decode()
+                        _LOGGER.info("Using account_module_index: %s", self._account_module_index)
                         return
                     
-                    # If no 32-char patterns, look for the specific account_module_index parameter
-                    module_patterns = [
-                        r'account_module_index["\']?\s*[:=]\s*["\']?([a-f0-9]{32})["\']?',
-                        r'graphicsdata\?account_module_index=([a-f0-9]{32})',
-                        r'data-account-module-index\s*=\s*["\']([a-f0-9]{32})["\']',
-                    ]
-                    
-                    for pattern in module_patterns:
-                        match = re.search(pattern, content)
-                        if match:
-                            self._account_module_index = match.group(1)
-                            _LOGGER.info(f"Found module index with pattern: {self._account_module_index}")
-                            return
+                    # Otherwise look for the specific account_module_index parameter
+                    match = _MODULE_IDX_RE.search(content)
+                    if match:
+                        self._account_module_index = match.group(1).decode()
+                        _LOGGER.info("Found module index with pattern: %s", self._account_module_index)
+                        return
                     
                     _LOGGER.warning("No 32-character account_module_index found in heatpump page")
                     
                     # Debug: log a snippet of the page to see what's there
-                    _LOGGER.debug(f"Heatpump page snippet: {content[:500]}...")
+                    _LOGGER.debug("Heatpump page snippet: %s...", bytes(content[:500]))
                     
                 else:
-                    _LOGGER.warning(f"Failed to load heatpump page: HTTP {response.status}")
+                    _LOGGER.warning("Failed to load heatpump page: HTTP %s", response.status)
                     
         except Exception as e:
-            _LOGGER.error(f"Error finding module index from heatpump page: {e}")
-            import traceback
-            _LOGGER.debug(f"Module index search traceback: {traceback.format_exc()}")
+            _LOGGER.error("Error finding module index from heatpump page: %s", e)
+            _LOGGER.debug("Module index search traceback", exc_info=True)
 
 # Legacy client class for backwards compatibility
 EpluconClient = EpluconAPI
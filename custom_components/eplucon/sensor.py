@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -11,15 +14,64 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import UnitOfEnergy, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SENSOR_TYPES
+from .const import DOMAIN, SENSOR_KEYS, SensorMeta, get_sensor_meta
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity ID of a sensor without its sensor type
+_ENTITY_ID_PREFIX = "sensor.eplucon_"
+
+# Attributes of sensors without coordinator data
+_EMPTY_ATTRS: Mapping[str, Any] = MappingProxyType({})
+
+
+# Device class, default unit and state class per sensor device class; a
+# device class missing here fails the import of the platform
+_DEVICE_CLASS_MAP: dict[
+    SensorDeviceClass | None,
+    tuple[SensorDeviceClass | None, str | None, SensorStateClass | None],
+] = {
+    SensorDeviceClass.TEMPERATURE: (
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        SensorStateClass.MEASUREMENT,
+    ),
+    SensorDeviceClass.ENERGY: (
+        SensorDeviceClass.ENERGY,
+        UnitOfEnergy.KILO_WATT_HOUR,
+        None,
+    ),
+    None: (None, None, None),
+}
+
+
+def _resolve_attrs(
+    meta: SensorMeta,
+) -> tuple[str, str, SensorDeviceClass | None, str | None, SensorStateClass | None]:
+    """Return name, icon, device class, unit and state class of a sensor."""
+    device_class, unit, state_class = _DEVICE_CLASS_MAP[meta.device_class]
+
+    if meta.unit:
+        unit = meta.unit
+
+    return meta.name, meta.icon, device_class, unit, state_class
+
+
+# Entity attributes per sensor type, resolved once at import
+_SENSOR_ATTRS = {key: _resolve_attrs(get_sensor_meta(key)) for key in SENSOR_KEYS}
+
+
+@lru_cache(maxsize=32)
+def _identifiers(entry_id: str) -> frozenset[tuple[str, str]]:
+    """Return the device identifiers of a config entry."""
+    return frozenset({(DOMAIN, entry_id)})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,95 +81,102 @@ async def async_setup_entry(
     """Set up Eplucon sensors from a config entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities = []
-    for sensor_type, sensor_config in SENSOR_TYPES.items():
-        entities.append(
+    # Shared by all sensors of the entry
+    device_info = DeviceInfo(
+        identifiers=_identifiers(config_entry.entry_id),
+        name="Eplucon Heat Pump",
+        manufacturer="Eplucon",
+        model="Heat Pump",
+        sw_version="1.0",
+    )
+    unique_id_prefix = config_entry.entry_id + "_"
+
+    async_add_entities(
+        [
             EpluconSensor(
                 coordinator=coordinator,
                 sensor_type=sensor_type,
-                config=sensor_config,
                 config_entry=config_entry,
+                device_info=device_info,
+                unique_id_prefix=unique_id_prefix,
             )
-        )
-
-    async_add_entities(entities, True)
+            for sensor_type in SENSOR_KEYS
+        ]
+    )
 
 
 class EpluconSensor(CoordinatorEntity, SensorEntity):
     """Representation of an Eplucon heat pump sensor."""
 
+    # The base classes keep a __dict__, slots only cover this class' attributes
+    __slots__ = ("_sensor_type", "_config_entry", "_getter")
+
     def __init__(
         self,
         coordinator,
         sensor_type: str,
-        config: dict,
         config_entry: ConfigEntry,
+        device_info: DeviceInfo,
+        unique_id_prefix: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         
         self._sensor_type = sensor_type
-        self._config = config
         self._config_entry = config_entry
+        self._getter = coordinator.get_value
         
-        # Set up entity attributes
-        self._attr_name = config["name"]  # Keep original friendly name
-        self._attr_unique_id = f"{config_entry.entry_id}_{sensor_type}"
-        self._attr_icon = config["icon"]
+        # Set up entity attributes, keeping the original friendly name
+        (
+            self._attr_name,
+            self._attr_icon,
+            self._attr_device_class,
+            self._attr_native_unit_of_measurement,
+            self._attr_state_class,
+        ) = _SENSOR_ATTRS[sensor_type]
+        self._attr_unique_id = unique_id_prefix + sensor_type
+        self._attr_device_info = device_info
         
         # Set entity_id with eplucon prefix for the actual entity ID
-        self.entity_id = f"sensor.eplucon_{sensor_type}"
+        self.entity_id = _ENTITY_ID_PREFIX + sensor_type
+
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Take over value, availability and attributes from the coordinator."""
+        coordinator = self.coordinator
+        value, present = self._getter(self._sensor_type)
+        self._attr_native_value = value
+        self._attr_available = coordinator.last_update_success and present
+
+        data = coordinator.data
+        if not data:
+            self._attr_extra_state_attributes = _EMPTY_ATTRS
+            return
+
+        attrs = {"stale": data.get("_stale", False)}
         
-        # Set up device class and unit
-        if config.get("device_class"):
-            if config["device_class"] == "temperature":
-                self._attr_device_class = SensorDeviceClass.TEMPERATURE
-                self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-                self._attr_state_class = SensorStateClass.MEASUREMENT
-            else:
-                self._attr_device_class = config["device_class"]
+        # Add some debug information
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            attrs["last_update"] = coordinator.last_update_success
+            if raw_data := data.get("raw_data"):
+                attrs["raw_value"] = raw_data.get(self._sensor_type)
         
-        if config.get("unit"):
-            self._attr_native_unit_of_measurement = config["unit"]
+        self._attr_extra_state_attributes = attrs
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "Eplucon Heat Pump",
-            "manufacturer": "Eplucon",
-            "model": "Heat Pump",
-            "sw_version": "1.0",
-        }
+    async def async_added_to_hass(self) -> None:
+        """Catch up on updates that arrived before the listener was registered."""
+        await super().async_added_to_hass()
+        self._update_from_coordinator()
 
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        if self.coordinator.data is None:
-            return None
-        
-        return self.coordinator.data.get(self._sensor_type)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self._sensor_type in self.coordinator.data
-        )
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = {}
-        
-        if self.coordinator.data:
-            attrs["last_update"] = self.coordinator.last_update_success
-            
-            # Add some debug information
-            if self.coordinator.data.get("raw_data"):
-                attrs["raw_value"] = self.coordinator.data["raw_data"].get(self._sensor_type)
-        
-        return attrs
+        # CoordinatorEntity bases availability on the coordinator alone
+        return self._attr_available
@@ -0,0 +1,29 @@
+"""Fixtures for the Eplucon integration tests."""
+from __future__ import annotations
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+HEAT_PUMP_DATA = {"supply_temperature_1": 35.5, "operation_mode": "Heating"}
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the integration from custom_components."""
+    yield
+
+
+@pytest.fixture
+def mock_api() -> Generator[MagicMock, None, None]:
+    """Replace the API client with a mock returning fixed heat pump data."""
+    with patch("custom_components.eplucon.EpluconAPI", autospec=True) as api_class:
+        api = api_class.return_value
+        api.is_authenticated = True
+        api.account_module_index = None
+        api.get_heat_pump_data = AsyncMock(side_effect=lambda: dict(HEAT_PUMP_DATA))
+        api.export_cookies.return_value = []
+        yield api
@@ -0,0 +1,111 @@
+"""Tests for setting up and unloading Eplucon config entries."""
+from __future__ import annotations
+
+import hashlib
+import time
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.eplucon.const import DOMAIN, STORAGE_VERSION
+
+ENTRY_DATA = {"email": "user@example.com", "password": "secret", "scan_interval": 1}
+
+
+async def test_unload_creating_entry_keeps_shared_coordinator(
+    hass: HomeAssistant, mock_api: MagicMock, freezer: FrozenDateTimeFactory
+) -> None:
+    """Unloading the entry that created a shared coordinator keeps it polling."""
+    first = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
+    second = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
+    first.add_to_hass(hass)
+    second.add_to_hass(hass)
+
+    # Setting up the domain loads both entries
+    assert await hass.config_entries.async_setup(first.entry_id)
+    await hass.async_block_till_done()
+    assert second.state is ConfigEntryState.LOADED
+
+    coordinator = hass.data[DOMAIN][first.entry_id]
+    assert hass.data[DOMAIN][second.entry_id] is coordinator
+    assert coordinator.config_entry is None
+
+    assert await hass.config_entries.async_unload(first.entry_id)
+    await hass.async_block_till_done()
+    assert first.state is ConfigEntryState.NOT_LOADED
+    mock_api.close.assert_not_called()
+
+    fetches = mock_api.get_heat_pump_data.await_count
+    freezer.tick(timedelta(minutes=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert mock_api.get_heat_pump_data.await_count > fetches
+    assert coordinator.last_update_success
+
+    assert await hass.config_entries.async_unload(second.entry_id)
+    await hass.async_block_till_done()
+    mock_api.close.assert_awaited_once()
+    assert DOMAIN not in hass.data or not hass.data[DOMAIN]["by_creds"]
+
+
+async def test_remove_entry_removes_stored_data(
+    hass: HomeAssistant,
+    mock_api: MagicMock,
+    freezer: FrozenDateTimeFactory,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Removing the last entry of an account does not leave its data behind."""
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # Past the delay of the save scheduled by the first refresh
+    freezer.tick(timedelta(minutes=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert not [key for key in hass_storage if key.startswith(f"{DOMAIN}.")]
+
+
+async def test_restored_data_covers_portal_outage(
+    hass: HomeAssistant, mock_api: MagicMock, hass_storage: dict[str, Any]
+) -> None:
+    """Restored data is kept when the portal is down right after a restart."""
+    credentials = f"{ENTRY_DATA['email']}:{ENTRY_DATA['password']}"
+    key = f"{DOMAIN}.{hashlib.sha1(credentials.encode()).hexdigest()}"
+    hass_storage[key] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "ts": time.time() - 60,
+            "data": {"supply_temperature_1": 30.0},
+            "module_index": None,
+            "cookies": [],
+        },
+    }
+    mock_api.get_heat_pump_data.side_effect = ConnectionError("portal down")
+
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_api.get_heat_pump_data.assert_awaited()
+    state = hass.states.get("sensor.eplucon_supply_temperature_1")
+    assert state.state != STATE_UNAVAILABLE
+    assert float(state.state) == 30.0